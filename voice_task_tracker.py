@@ -7,46 +7,57 @@ It utilizes speech recognition to understand voice commands, text-to-speech for
 and a Tkinter GUI for visual interaction.
 """
 
+import logging
 import os
-import json
+import queue
+import re
+import struct
+import threading
+from typing import List, Tuple, Union
+
+import msgspec
 import speech_recognition as sr
 import pyttsx3
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 
-class Task:
-    """A class representing a task in the to-do list."""
+logger = logging.getLogger(__name__)
+
+
+class Task(msgspec.Struct, gc=False):
+    """
+    A class representing a task in the to-do list.
     
-    def __init__(self, task_id, description, completed=False):
-        """
-        Initialize a task with an ID, description, and completion status.
-        
-        Args:
-            task_id (int): The unique ID of the task.
-            description (str): A description of the task.
-            completed (bool, optional): Whether the task is completed. Defaults to False.
-        """
-        self.id = task_id
-        self.description = description
-        self.completed = completed
-    
-    def to_dict(self):
-        """Convert the task to a dictionary for serialization."""
-        return {
-            'id': self.id,
-            'description': self.description,
-            'completed': self.completed
-        }
+    Tasks only hold scalar fields and can never form reference cycles, so
+    they are kept out of the cyclic garbage collector.
     
-    @classmethod
-    def from_dict(cls, task_dict):
-        """Create a task from a dictionary."""
-        return cls(
-            task_id=task_dict['id'],
-            description=task_dict['description'],
-            completed=task_dict['completed']
-        )
+    Attributes:
+        id (int): The unique ID of the task.
+        description (str): A description of the task.
+        completed (bool): Whether the task is completed. Defaults to False.
+    """
+    
+    id: int
+    description: str
+    completed: bool = False
+
+
+# Encoders/decoders are reused across calls; msgspec walks Task structs in C
+_task_encoder = msgspec.json.Encoder()
+_task_list_decoder = msgspec.json.Decoder(List[Task])
+
+# Change log records are ("add" | "update", Task) or ("delete", task_id) pairs,
+# each framed with a 4-byte big-endian length header
+_log_encoder = msgspec.msgpack.Encoder()
+_log_record_decoder = msgspec.msgpack.Decoder(Tuple[str, Union[Task, int]])
+_FRAME_HEADER = struct.Struct('>I')
+
+# Fold the change log into a fresh snapshot once it grows past this size (bytes)
+LOG_COMPACT_THRESHOLD = 1024 * 1024
+
+# Seconds to hold changes before writing them, so bursts share a single write
+SAVE_DELAY = 0.5
 
 
 class TaskManager:
@@ -58,10 +69,20 @@ class TaskManager:
         
         Args:
             save_file (str, optional): The file path to save tasks to. Defaults to "tasks.json".
+                Changes made since the last snapshot are appended to save_file + ".log".
         """
-        self.tasks = []
+        self.tasks = {}  # task ID -> Task, in insertion order
+        self._desc_lower = {}  # task ID -> lowercased description, for find_by_desc
+        self._token_index = {}  # lowercased word -> IDs of tasks whose description has it
         self.next_id = 1
         self.save_file = save_file
+        self.log_file = save_file + ".log"
+        self._log_fp = open(self.log_file, 'ab', buffering=0)
+        self._log_size = 0
+        self._pending = []  # encoded frames not yet written to the log
+        self._save_timer = None
+        # Guards the log and pending frames against the save timer's thread
+        self._lock = threading.RLock()
         self.load_tasks()
     
     def add_task(self, description):
@@ -75,9 +96,10 @@ class TaskManager:
             Task: The newly created task.
         """
         task = Task(self.next_id, description)
-        self.tasks.append(task)
+        self.tasks[task.id] = task
+        self._index_description(task.id, description)
         self.next_id += 1
-        self.save_tasks()
+        self._append_log("add", task)
         return task
     
     def update_task(self, task_id, description=None, completed=None):
@@ -98,10 +120,12 @@ class TaskManager:
         
         if description is not None:
             task.description = description
+            self._unindex_description(task_id)
+            self._index_description(task_id, description)
         if completed is not None:
             task.completed = completed
         
-        self.save_tasks()
+        self._append_log("update", task)
         return task
     
     def delete_task(self, task_id):
@@ -112,15 +136,16 @@ class TaskManager:
             task_id (int): The ID of the task to delete.
             
         Returns:
-            bool: True if the task was deleted, False otherwise.
+            Task: The deleted task, or None if not found.
         """
-        task = self.get_task(task_id)
+        task = self.tasks.pop(task_id, None)
         if not task:
-            return False
+            return None
         
-        self.tasks.remove(task)
-        self.save_tasks()
-        return True
+        self._unindex_description(task_id)
+        del self._desc_lower[task_id]
+        self._append_log("delete", task_id)
+        return task
     
     def get_task(self, task_id):
         """
@@ -132,10 +157,24 @@ class TaskManager:
         Returns:
             Task: The task, or None if not found.
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self.tasks.get(task_id)
+    
+    def find_by_desc(self, text):
+        """
+        Find tasks whose description contains the given text, ignoring case.
+        
+        Args:
+            text (str): The text to search for.
+            
+        Returns:
+            list: A list of the matching tasks.
+        """
+        text = text.lower()
+        candidates = self._candidate_ids(text.split())
+        if candidates is None:
+            return [self.tasks[task_id] for task_id, desc in self._desc_lower.items() if text in desc]
+        return [self.tasks[task_id] for task_id in sorted(candidates)
+                if text in self._desc_lower[task_id]]
     
     def get_all_tasks(self):
         """
@@ -144,44 +183,209 @@ class TaskManager:
         Returns:
             list: A list of all tasks.
         """
-        return self.tasks
+        return list(self.tasks.values())
     
     def save_tasks(self):
-        """Save tasks to a file."""
-        with open(self.save_file, 'w') as f:
-            json.dump([task.to_dict() for task in self.tasks], f)
+        """Save a snapshot of all tasks to a file and clear the change log."""
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            # Log any queued changes first, so the log never lags behind the
+            # snapshot if we die before truncating it below
+            if self._pending:
+                self._log_fp.write(b"".join(self._pending))
+                self._pending.clear()
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # leaves the previous snapshot intact rather than a truncated one
+            tmp_file = self.save_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_task_encoder.encode(list(self.tasks.values())))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.save_file)
+            self._log_fp.truncate(0)
+            self._log_size = 0
+    
+    def flush(self):
+        """Write any pending changes to the change log."""
+        with self._lock:
+            self._save_timer = None
+            if not self._pending:
+                return
+            data = b"".join(self._pending)
+            self._pending.clear()
+            self._log_fp.write(data)
+            self._log_size += len(data)
+            if self._log_size > LOG_COMPACT_THRESHOLD:
+                self.save_tasks()
     
     def load_tasks(self):
-        """Load tasks from a file."""
+        """Load tasks from a file, replaying any changes logged since the last snapshot."""
+        self.tasks = {}
         if os.path.exists(self.save_file):
             try:
-                with open(self.save_file, 'r') as f:
-                    tasks_data = json.load(f)
-                    
-                self.tasks = [Task.from_dict(task_dict) for task_dict in tasks_data]
-                
-                # Update next_id to be one more than the maximum ID
-                if self.tasks:
-                    self.next_id = max(task.id for task in self.tasks) + 1
-                else:
-                    self.next_id = 1
-            except (json.JSONDecodeError, KeyError):
+                with open(self.save_file, 'rb') as f:
+                    tasks = _task_list_decoder.decode(f.read())
+                # next_id below relies on tasks being stored in increasing ID
+                # order, which a hand-edited file may not respect
+                if any(prev.id >= task.id for prev, task in zip(tasks, tasks[1:])):
+                    tasks.sort(key=lambda task: task.id)
+                self.tasks = {task.id: task for task in tasks}
+            except msgspec.DecodeError:
                 # If the file is invalid, start with an empty task list
-                self.tasks = []
-                self.next_id = 1
+                self.tasks = {}
+        
+        with open(self.log_file, 'rb') as f:
+            log_data = f.read()
+        self._replay_log(log_data)
+        self._desc_lower = {}
+        self._token_index = {}
+        for task in self.tasks.values():
+            self._index_description(task.id, task.description)
+        
+        # Update next_id to be one more than the maximum ID; the snapshot is in
+        # ID order and replayed adds only ever append higher IDs, so the most
+        # recently inserted task has it
+        if self.tasks:
+            self.next_id = next(reversed(self.tasks)) + 1
+        else:
+            self.next_id = 1
+        
+        # Fold the replayed changes into the snapshot so the log starts empty
+        if log_data:
+            self.save_tasks()
+    
+    def close(self):
+        """Save a compacted snapshot and close the change log."""
+        self.save_tasks()
+        self._log_fp.close()
+    
+    def _index_description(self, task_id, description):
+        """
+        Add a task's description to the lookup tables used by find_by_desc.
+        
+        Args:
+            task_id (int): The ID of the task.
+            description (str): The task's description.
+        """
+        desc = description.lower()
+        self._desc_lower[task_id] = desc
+        for word in set(desc.split()):
+            self._token_index.setdefault(word, set()).add(task_id)
+    
+    def _unindex_description(self, task_id):
+        """
+        Remove a task's description from the word index used by find_by_desc.
+        
+        Args:
+            task_id (int): The ID of the task.
+        """
+        for word in set(self._desc_lower[task_id].split()):
+            task_ids = self._token_index[word]
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self._token_index[word]
+    
+    def _candidate_ids(self, words):
+        """
+        Narrow down the tasks whose description could contain the given words in order.
+        
+        Only inner words are guaranteed to appear whole in a matching
+        description (the first may end a longer word and the last may start
+        one), so only their index entries are used.
+        
+        Args:
+            words (list): The lowercased words to look for.
+            
+        Returns:
+            set: The IDs of the candidate tasks, or None if the index can't
+                usefully narrow the search.
+        """
+        inner = words[1:-1]
+        if not inner:
+            return None
+        postings = sorted((self._token_index.get(word, set()) for word in inner), key=len)
+        if len(postings[0]) > len(self._desc_lower) // 2:
+            return None
+        return postings[0].intersection(*postings[1:])
+    
+    def _append_log(self, op, payload):
+        """
+        Queue a single change record for the log, to be written within SAVE_DELAY seconds.
+        
+        Args:
+            op (str): The operation, one of "add", "update" or "delete".
+            payload (Task or int): The affected task, or its ID for "delete".
+        """
+        record = _log_encoder.encode((op, payload))
+        with self._lock:
+            self._pending.append(_FRAME_HEADER.pack(len(record)))
+            self._pending.append(record)
+            if not self._save_timer:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def _replay_log(self, data):
+        """
+        Apply the change records in a log to the loaded tasks.
+        
+        Args:
+            data (bytes): The raw contents of the log file.
+        """
+        view = memoryview(data)
+        offset = 0
+        while offset + _FRAME_HEADER.size <= len(data):
+            (length,) = _FRAME_HEADER.unpack_from(data, offset)
+            offset += _FRAME_HEADER.size
+            if offset + length > len(data):
+                # Truncated frame left behind by an interrupted write
+                break
+            try:
+                op, payload = _log_record_decoder.decode(view[offset:offset + length])
+            except msgspec.DecodeError:
+                break
+            offset += length
+            
+            if op == "delete":
+                self.tasks.pop(payload, None)
+            else:
+                # "add" and "update" both replace any task with the same ID, so
+                # replaying records already folded into the snapshot is harmless
+                self.tasks[payload.id] = payload
+
+
+# Audio is downsampled to the 16 kHz rate Google's recognizer is tuned for before
+# upload; the FLAC payload is roughly a third of the size of 44.1/48 kHz audio
+SAMPLE_RATE = 16000
+
+# Seconds of silence that end an utterance (speech_recognition defaults to 0.8)
+PAUSE_THRESHOLD = 0.5
 
 
 class VoiceRecognizer:
     """Handles voice recognition and command interpretation."""
     
+    # The first command keyword in the utterance and everything after it
+    _COMMAND_RE = re.compile(
+        r"\b(?:(?P<add>add|create)|(?P<delete>delete|remove)"
+        r"|(?P<complete>complete|mark done)|(?P<list>list|show))\b\s*(?P<rest>.*)"
+    )
+    
     def __init__(self):
         """Initialize the voice recognizer."""
         self.recognizer = sr.Recognizer()
+        # Stop recording sooner once the speaker falls silent
+        self.recognizer.pause_threshold = PAUSE_THRESHOLD
+        # Keep the microphone stream open for the recognizer's lifetime so each
+        # command doesn't pay for opening and closing an audio device
+        self.microphone = sr.Microphone()
+        self.microphone.__enter__()
         # Adjust for ambient noise when the recognizer instance is initialized
         # This helps improve voice recognition accuracy
         try:
-            with sr.Microphone() as source:
-                self.recognizer.adjust_for_ambient_noise(source)
+            self.recognizer.adjust_for_ambient_noise(self.microphone)
         except (sr.RequestError, sr.UnknownValueError):
             # Handle case where microphone is not available or ambient noise adjustment fails
             pass
@@ -194,9 +398,13 @@ class VoiceRecognizer:
             str: The recognized speech, or None if recognition failed.
         """
         try:
-            with sr.Microphone() as source:
-                audio = self.recognizer.listen(source)
-                
+            self._discard_buffered_audio()
+            audio = self.recognizer.listen(self.microphone)
+            # Capture happens at the device's own rate, which not every device
+            # can change, so the audio is downsampled here instead
+            if audio.sample_rate > SAMPLE_RATE:
+                audio = sr.AudioData(audio.get_raw_data(convert_rate=SAMPLE_RATE),
+                                     SAMPLE_RATE, audio.sample_width)
             text = self.recognizer.recognize_google(audio)
             return text
         except sr.UnknownValueError:
@@ -204,6 +412,20 @@ class VoiceRecognizer:
         except sr.RequestError:
             return None
     
+    def _discard_buffered_audio(self):
+        """
+        Drop audio the open stream recorded since the last listen.
+        
+        The microphone stays open between commands, so its buffer holds
+        whatever played meanwhile, including our own spoken feedback.
+        """
+        pyaudio_stream = self.microphone.stream.pyaudio_stream
+        pyaudio_stream.read(pyaudio_stream.get_read_available(), exception_on_overflow=False)
+    
+    def close(self):
+        """Release the microphone."""
+        self.microphone.__exit__(None, None, None)
+    
     def interpret_command(self, text):
         """
         Interpret a voice command.
@@ -217,47 +439,25 @@ class VoiceRecognizer:
         if not text:
             return None, None
         
-        text = text.lower()
+        match = self._COMMAND_RE.search(text.lower())
+        if not match:
+            return None, None
         
-        if "add" in text or "create" in text:
-            # Extract the task description after "add" or "create"
-            parts = text.split("add ", 1) if "add" in text else text.split("create ", 1)
-            if len(parts) > 1:
-                return "add", parts[1]
-            return "add", ""
-        
-        elif "delete" in text or "remove" in text:
-            # Try to extract a task number
-            words = text.split()
-            for i, word in enumerate(words):
-                if word in ["delete", "remove"] and i+1 < len(words):
-                    try:
-                        task_id = int(words[i+1])
-                        return "delete", task_id
-                    except ValueError:
-                        # If the next word is not a number, try to use the rest as a description
-                        if i+1 < len(words):
-                            return "delete_by_desc", " ".join(words[i+1:])
-            return "delete", None
-        
-        elif "complete" in text or "mark done" in text:
-            # Try to extract a task number
-            words = text.split()
-            for i, word in enumerate(words):
-                if word in ["complete", "done"] and i+1 < len(words):
-                    try:
-                        task_id = int(words[i+1])
-                        return "complete", task_id
-                    except ValueError:
-                        # If the next word is not a number, try to use the rest as a description
-                        if i+1 < len(words):
-                            return "complete_by_desc", " ".join(words[i+1:])
-            return "complete", None
-        
-        elif "list" in text or "show" in text:
+        rest = match["rest"].strip()
+        if match["add"]:
+            return "add", rest
+        if match["list"]:
             return "list", None
         
-        return None, None
+        command = "delete" if match["delete"] else "complete"
+        if not rest:
+            return command, None
+        # Try to extract a task number
+        try:
+            return command, int(rest.split(maxsplit=1)[0])
+        except ValueError:
+            # If the next word is not a number, use the rest as a description
+            return command + "_by_desc", rest
 
 
 class VoiceFeedback:
@@ -265,19 +465,47 @@ class VoiceFeedback:
     
     def __init__(self):
         """Initialize the voice feedback system."""
-        self.engine = pyttsx3.init()
-        # Can set properties like rate, volume, etc.
-        self.engine.setProperty('rate', 150)  # Speed of speech
+        self.engine = None
+        # Speech is played on a dedicated thread so callers never block on it
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
     
     def speak(self, text):
         """
-        Speak the given text.
+        Queue the given text to be spoken, returning immediately.
         
         Args:
             text (str): The text to speak.
         """
-        self.engine.say(text)
-        self.engine.runAndWait()
+        self._queue.put(text)
+    
+    def wait(self):
+        """Block until all queued text has been spoken."""
+        self._queue.join()
+    
+    def _run(self):
+        """Speak queued text, one utterance at a time."""
+        # The engine is bound to the thread that creates it (COM on Windows,
+        # the run loop on macOS), so it is created here rather than in __init__
+        try:
+            self.engine = pyttsx3.init()
+            # Can set properties like rate, volume, etc.
+            self.engine.setProperty('rate', 150)  # Speed of speech
+        except Exception:
+            logger.exception("Text-to-speech is unavailable")
+            self.engine = None
+        
+        # Keep consuming the queue even if speech fails, so wait() never hangs
+        while True:
+            text = self._queue.get()
+            try:
+                if self.engine:
+                    self.engine.say(text)
+                    self.engine.runAndWait()
+            except Exception:
+                logger.exception("Failed to speak %r", text)
+            finally:
+                self._queue.task_done()
 
 
 class TaskTrackerApp:
@@ -297,6 +525,22 @@ class TaskTrackerApp:
         self.task_manager = TaskManager()
         self.voice_recognizer = VoiceRecognizer()
         self.voice_feedback = VoiceFeedback()
+        self._listening = False
+        # The listen worker and on_close agree through these on which of them
+        # releases the microphone, so it is never closed mid-read
+        self._mic_lock = threading.Lock()
+        self._mic_in_use = False
+        self._closing = False
+        
+        # Voice command -> handler, as returned by VoiceRecognizer.interpret_command
+        self._command_handlers = {
+            "add": self._add_command,
+            "delete": self._delete_command,
+            "delete_by_desc": self._delete_by_desc_command,
+            "complete": self._complete_command,
+            "complete_by_desc": self._complete_by_desc_command,
+            "list": self._list_command,
+        }
         
         self.create_widgets()
         self.update_task_list()
@@ -379,22 +623,49 @@ class TaskTrackerApp:
     
     def update_task_list(self):
         """Update the task list display."""
-        # Clear the current list
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
+        # Clear the current list in a single call
+        self.task_tree.delete(*self.task_tree.get_children())
         
         # Add all tasks
         for task in self.task_manager.get_all_tasks():
-            status = "Completed" if task.completed else "Pending"
-            self.task_tree.insert("", "end", values=(task.id, task.description, status))
+            self.insert_task_row(task)
+    
+    def insert_task_row(self, task):
+        """
+        Append a row for a new task to the task list display.
+        
+        Args:
+            task (Task): The task to display.
+        """
+        status = "Completed" if task.completed else "Pending"
+        self.task_tree.insert("", "end", iid=str(task.id), values=(task.id, task.description, status))
+    
+    def refresh_task_row(self, task):
+        """
+        Redraw the row of a task that has changed.
+        
+        Args:
+            task (Task): The updated task.
+        """
+        status = "Completed" if task.completed else "Pending"
+        self.task_tree.item(str(task.id), values=(task.id, task.description, status))
+    
+    def remove_task_row(self, task_id):
+        """
+        Remove the row of a deleted task from the task list display.
+        
+        Args:
+            task_id (int): The ID of the deleted task.
+        """
+        self.task_tree.delete(str(task_id))
     
     def add_task(self):
         """Add a new task from the entry field."""
         description = self.task_entry.get().strip()
         if description:
-            self.task_manager.add_task(description)
+            task = self.task_manager.add_task(description)
             self.task_entry.delete(0, tk.END)  # Clear the entry
-            self.update_task_list()
+            self.insert_task_row(task)
             self.status_var.set(f"Added task: {description}")
     
     def complete_task(self):
@@ -406,8 +677,9 @@ class TaskTrackerApp:
         
         # Get the task ID from the selected item
         task_id = int(self.task_tree.item(selected_item[0], "values")[0])
-        self.task_manager.update_task(task_id, completed=True)
-        self.update_task_list()
+        task = self.task_manager.update_task(task_id, completed=True)
+        if task:
+            self.refresh_task_row(task)
         self.status_var.set(f"Marked task {task_id} as complete")
     
     def delete_task(self):
@@ -420,8 +692,8 @@ class TaskTrackerApp:
         # Get the task ID from the selected item
         task_id = int(self.task_tree.item(selected_item[0], "values")[0])
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete task {task_id}?"):
-            self.task_manager.delete_task(task_id)
-            self.update_task_list()
+            if self.task_manager.delete_task(task_id):
+                self.remove_task_row(task_id)
             self.status_var.set(f"Deleted task {task_id}")
     
     def toggle_task_completion(self, event):
@@ -437,136 +709,183 @@ class TaskTrackerApp:
         
         # Toggle the completion status
         new_completed = current_status != "Completed"
-        self.task_manager.update_task(task_id, completed=new_completed)
-        self.update_task_list()
+        task = self.task_manager.update_task(task_id, completed=new_completed)
+        if task:
+            self.refresh_task_row(task)
         
         new_status = "completed" if new_completed else "pending"
         self.status_var.set(f"Updated task {task_id} to {new_status}")
     
     def start_voice_command(self):
         """Start listening for a voice command."""
+        if self._listening:
+            return
+        self._listening = True
         self.status_var.set("Listening...")
         self.voice_feedback.speak("Listening for command")
-        self.root.after(100, self.process_voice_command)
+        with self._mic_lock:
+            self._mic_in_use = True
+        threading.Thread(target=self._listen_worker, daemon=True).start()
+    
+    def _listen_worker(self):
+        """Listen for a voice command on a worker thread so the GUI stays responsive."""
+        text = None
+        try:
+            # Let the prompt finish first; listen() then discards it from the
+            # capture buffer so it isn't mistaken for the start of the command
+            self.voice_feedback.wait()
+            text = self.voice_recognizer.listen()
+        finally:
+            with self._mic_lock:
+                self._mic_in_use = False
+                closing = self._closing
+            if closing:
+                # The window was closed while we were listening
+                self.voice_recognizer.close()
+            else:
+                try:
+                    # Always report back, even on failure, so the command can be
+                    # retried. Tkinter widgets must only be touched from the main loop
+                    self.root.after(0, self.process_voice_command, text)
+                except (tk.TclError, RuntimeError):
+                    # Expected only if the window was closed after the check above
+                    if not self._closing:
+                        logger.exception("Could not hand the voice command back to the GUI")
+                        # Let the next Voice Command click start a fresh listen
+                        self._listening = False
     
-    def process_voice_command(self):
-        """Process the voice command."""
-        text = self.voice_recognizer.listen()
+    def process_voice_command(self, text):
+        """
+        Process the voice command.
+        
+        Args:
+            text (str): The recognized speech, or None if recognition failed.
+        """
+        self._listening = False
         if not text:
             self.status_var.set("Sorry, I didn't catch that.")
             self.voice_feedback.speak("Sorry, I didn't catch that")
             return
         
         command, param = self.voice_recognizer.interpret_command(text)
-        
-        if command == "add":
-            if param:
-                self.task_manager.add_task(param)
-                self.update_task_list()
-                feedback = f"Added task: {param}"
-                self.status_var.set(feedback)
-                self.voice_feedback.speak(feedback)
-            else:
-                self.status_var.set("Please specify a task to add.")
-                self.voice_feedback.speak("Please specify a task to add")
-        
-        elif command == "delete" and param is not None:
-            if isinstance(param, int):
-                task = self.task_manager.get_task(param)
-                if task:
-                    self.task_manager.delete_task(param)
-                    self.update_task_list()
-                    feedback = f"Deleted task {param}"
-                    self.status_var.set(feedback)
-                    self.voice_feedback.speak(feedback)
-                else:
-                    feedback = f"Task {param} not found"
-                    self.status_var.set(feedback)
-                    self.voice_feedback.speak(feedback)
-            else:
-                self.status_var.set("Please specify a task number to delete.")
-                self.voice_feedback.speak("Please specify a task number to delete")
-        
-        elif command == "delete_by_desc":
-            # Try to find a task with a matching description
-            matching_tasks = [task for task in self.task_manager.get_all_tasks() 
-                             if param.lower() in task.description.lower()]
-            if len(matching_tasks) == 1:
-                task = matching_tasks[0]
-                self.task_manager.delete_task(task.id)
-                self.update_task_list()
-                feedback = f"Deleted task: {task.description}"
-                self.status_var.set(feedback)
-                self.voice_feedback.speak(feedback)
-            elif len(matching_tasks) > 1:
-                feedback = "Multiple matching tasks found. Please be more specific."
-                self.status_var.set(feedback)
-                self.voice_feedback.speak(feedback)
-            else:
-                feedback = "No matching task found."
+        self._command_handlers.get(command, self._unknown_command)(param, text)
+    
+    def _add_command(self, param, text):
+        """Handle the "add" voice command."""
+        if param:
+            task = self.task_manager.add_task(param)
+            self.insert_task_row(task)
+            feedback = f"Added task: {param}"
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        else:
+            self.status_var.set("Please specify a task to add.")
+            self.voice_feedback.speak("Please specify a task to add")
+    
+    def _delete_command(self, param, text):
+        """Handle the "delete" voice command."""
+        if isinstance(param, int):
+            if self.task_manager.delete_task(param):
+                self.remove_task_row(param)
+                feedback = f"Deleted task {param}"
                 self.status_var.set(feedback)
                 self.voice_feedback.speak(feedback)
-        
-        elif command == "complete" and param is not None:
-            if isinstance(param, int):
-                task = self.task_manager.get_task(param)
-                if task:
-                    self.task_manager.update_task(param, completed=True)
-                    self.update_task_list()
-                    feedback = f"Marked task {param} as complete"
-                    self.status_var.set(feedback)
-                    self.voice_feedback.speak(feedback)
-                else:
-                    feedback = f"Task {param} not found"
-                    self.status_var.set(feedback)
-                    self.voice_feedback.speak(feedback)
             else:
-                self.status_var.set("Please specify a task number to complete.")
-                self.voice_feedback.speak("Please specify a task number to complete")
-        
-        elif command == "complete_by_desc":
-            # Try to find a task with a matching description
-            matching_tasks = [task for task in self.task_manager.get_all_tasks() 
-                             if param.lower() in task.description.lower()]
-            if len(matching_tasks) == 1:
-                task = matching_tasks[0]
-                self.task_manager.update_task(task.id, completed=True)
-                self.update_task_list()
-                feedback = f"Marked task as complete: {task.description}"
+                feedback = f"Task {param} not found"
                 self.status_var.set(feedback)
                 self.voice_feedback.speak(feedback)
-            elif len(matching_tasks) > 1:
-                feedback = "Multiple matching tasks found. Please be more specific."
+        else:
+            self.status_var.set("Please specify a task number to delete.")
+            self.voice_feedback.speak("Please specify a task number to delete")
+    
+    def _delete_by_desc_command(self, param, text):
+        """Handle the "delete" voice command when given a description."""
+        # Try to find a task with a matching description
+        matching_tasks = self.task_manager.find_by_desc(param)
+        if len(matching_tasks) == 1:
+            task = matching_tasks[0]
+            self.task_manager.delete_task(task.id)
+            self.remove_task_row(task.id)
+            feedback = f"Deleted task: {task.description}"
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        elif len(matching_tasks) > 1:
+            feedback = "Multiple matching tasks found. Please be more specific."
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        else:
+            feedback = "No matching task found."
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+    
+    def _complete_command(self, param, text):
+        """Handle the "complete" voice command."""
+        if isinstance(param, int):
+            task = self.task_manager.update_task(param, completed=True)
+            if task:
+                self.refresh_task_row(task)
+                feedback = f"Marked task {param} as complete"
                 self.status_var.set(feedback)
                 self.voice_feedback.speak(feedback)
             else:
-                feedback = "No matching task found."
-                self.status_var.set(feedback)
-                self.voice_feedback.speak(feedback)
-        
-        elif command == "list":
-            tasks = self.task_manager.get_all_tasks()
-            if not tasks:
-                feedback = "Your task list is empty."
+                feedback = f"Task {param} not found"
                 self.status_var.set(feedback)
                 self.voice_feedback.speak(feedback)
-            else:
-                feedback = "Here are your tasks: "
-                for task in tasks:
-                    status = "completed" if task.completed else "pending"
-                    feedback += f"Task {task.id}, {task.description}, {status}. "
-                
-                self.status_var.set("Listed all tasks")
-                self.voice_feedback.speak(feedback)
-        
         else:
-            self.status_var.set(f"Command not recognized: {text}")
-            self.voice_feedback.speak("Command not recognized")
+            self.status_var.set("Please specify a task number to complete.")
+            self.voice_feedback.speak("Please specify a task number to complete")
+    
+    def _complete_by_desc_command(self, param, text):
+        """Handle the "complete" voice command when given a description."""
+        # Try to find a task with a matching description
+        matching_tasks = self.task_manager.find_by_desc(param)
+        if len(matching_tasks) == 1:
+            task = matching_tasks[0]
+            self.task_manager.update_task(task.id, completed=True)
+            self.refresh_task_row(task)
+            feedback = f"Marked task as complete: {task.description}"
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        elif len(matching_tasks) > 1:
+            feedback = "Multiple matching tasks found. Please be more specific."
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        else:
+            feedback = "No matching task found."
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+    
+    def _list_command(self, param, text):
+        """Handle the "list" voice command."""
+        tasks = self.task_manager.get_all_tasks()
+        if not tasks:
+            feedback = "Your task list is empty."
+            self.status_var.set(feedback)
+            self.voice_feedback.speak(feedback)
+        else:
+            self.status_var.set("Listed all tasks")
+            # Queue one sentence per task so speech starts with the first
+            # task instead of after the whole list has been synthesized
+            self.voice_feedback.speak("Here are your tasks.")
+            for task in tasks:
+                status = "completed" if task.completed else "pending"
+                self.voice_feedback.speak(f"Task {task.id}, {task.description}, {status}.")
+    
+    def _unknown_command(self, param, text):
+        """Handle speech that isn't a recognized command."""
+        self.status_var.set(f"Command not recognized: {text}")
+        self.voice_feedback.speak("Command not recognized")
     
     def on_close(self):
         """Handle window close event."""
-        # Make sure tasks are saved
-        self.task_manager.save_tasks()
+        # Make sure tasks are saved and the change log is compacted
+        self.task_manager.close()
+        # Leave the microphone to the listen worker if it is still reading from it
+        with self._mic_lock:
+            self._closing = True
+            mic_in_use = self._mic_in_use
+        if not mic_in_use:
+            self.voice_recognizer.close()
         self.root.destroy()
 
 